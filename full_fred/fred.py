@@ -7,6 +7,7 @@ class Fred(Tags):
         api_key_file: str = None,
         observation_start: str = None,
         observation_end: str = None,
+        cache_file: str = None,
     ):
         """
         API Key
@@ -36,6 +37,27 @@ class Fred(Tags):
         data for values. For example, after calling fred.get_tags(), fred.tag_stack["get_tags"] will return the data FRED web service responded with,
         until a new get_tags method invocation is made or you pop "get_tags".
 
+        Response Cache
+        --------------
+        Responses are kept in memory for fred.cache_expire_after seconds (3600 by default) so repeating a query doesn't send it to FRED again.
+        Up to fred.cache_maxsize (256) responses are kept, least recently used first out.
+        Set fred.cache_expire_after = 0 to turn caching off, call fred.clear_cache() to drop every cached response.
+
+            cache_file
+            ----------
+            Fred(cache_file = 'fred_cache.sqlite')
+            fred.set_cache_file('fred_cache.sqlite')
+
+            Responses are also stored in this SQLite database, so running the same queries in a later session doesn't send them to FRED
+            until they're fred.cache_expire_after seconds old. Entries are keyed by request URL without the api key.
+
+        Concurrent Requests
+        -------------------
+        Source and tag methods have awaitable counterparts prefixed with "a", e.g. fred.aget_a_source for fred.get_a_source. fred.gather runs
+        them concurrently, at most fred.max_concurrent_requests at a time, and returns their results in order:
+            fred.gather(*(fred.aget_a_source(i) for i in (1, 3, 57)))
+        A request that gets no answer from FRED within fred.timeout seconds (30 by default) returns None.
+
         Setting Realtime, Observation Start/End Defaults
         -------------------------
         fred.realtime_start: if set, will be used when realtime_start argument is not given. 
@@ -55,3 +77,5 @@ class Fred(Tags):
             self.set_api_key_file(api_key_file)
         else:
             self.api_key_file = api_key_file
+        if cache_file is not None:
+            self.set_cache_file(cache_file)
@@ -1,9 +1,136 @@
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import partial
+from numbers import Integral
+from urllib.parse import urlencode
 import requests
+import asyncio
+import inspect
+import re
+import sqlite3
+import threading
+import time
 import os
 
+try:
+    # orjson parses FRED's larger responses several times faster
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    from json import dumps as json_dumps, loads as json_loads
+
+
+def endpoint_methods(stack_name: str):
+    """
+    Class decorator that generates, for each method named in the class's
+    _ENDPOINTS, the _<method>_url builder and the awaitable a<method>.
+
+    _ENDPOINTS maps a method name to a tuple of
+        url prefix, e.g. "source?source_id="
+        name of the id parameter appended to the url prefix, or None
+        names of the query parameters, in the method's signature order
+        key of the results list paginate merges, or None if not paginated
+    Each function is compiled once from straight-line source with the
+    method's parameter names, so a query builds its url without looping
+    over a spec, and a<method> always has the same signature as <method>.
+    Query parameters without a default in <method>, e.g. tag_names, raise
+    TypeError in the builder when None instead of being left out of the url.
+    Results are stored in the stack named stack_name.
+    """
+
+    def decorate(cls):
+        for name, spec in cls.__dict__["_ENDPOINTS"].items():
+            url_prefix, id_param, keys, results_key = spec
+            method = cls.__dict__[name]
+            params = list(inspect.signature(method).parameters.values())[1:]
+            builder_params = [p.name for p in params if p.name != "paginate"]
+            expected_params = ([id_param] if id_param else []) + list(keys)
+            if builder_params != expected_params:
+                e = "%s parameters %s don't match _ENDPOINTS %s" % (
+                    name,
+                    builder_params,
+                    expected_params,
+                )
+                raise TypeError(e)
+            signature = ", ".join(
+                p.name if p.default is p.empty else "%s=%r" % (p.name, p.default)
+                for p in params
+            )
+            args = ", ".join(builder_params)
+            values = "".join(k + ", " for k in keys)
+            # required query parameters, e.g. tag_names, must not be left out
+            # the way None optional parameters are
+            required_checks = "".join(
+                "    if %s is None:\n"
+                "        raise TypeError('%s requires %s')\n" % (p.name, name, p.name)
+                for p in params
+                if p.default is p.empty and p.name in keys
+            )
+            if id_param:
+                prefix_expr = "self._append_id_to_url(%r, %s)" % (url_prefix, id_param)
+            else:
+                prefix_expr = repr(url_prefix)
+            if results_key:
+                fetch = (
+                    "    if paginate:\n"
+                    "        response = await self._afetch_pages(url, %r)\n"
+                    "    else:\n"
+                    "        response = await self._afetch_data(url)\n" % results_key
+                )
+            else:
+                fetch = "    response = await self._afetch_data(url)\n"
+            source = (
+                "def _%s_url(self, %s):\n"
+                "%s"
+                "    self._viable_api_key()\n"
+                "    url_prefix = %s\n"
+                "    return self._add_query_params(url_prefix, keys, (%s))\n"
+                "\n"
+                "async def a%s(self, %s):\n"
+                "    url = self._%s_url(%s)\n"
+                "%s"
+                "    self.%s[%r] = response\n"
+                "    return response\n"
+            ) % (
+                name, args, required_checks, prefix_expr, values,
+                name, signature, name, args, fetch, stack_name, name,
+            )
+            # __name__ gives the generated functions cls's __module__
+            namespace = {"__name__": cls.__module__, "keys": tuple(keys)}
+            exec(compile(source, "<%s.%s>" % (cls.__name__, name), "exec"), namespace)
+
+            builder = namespace["_%s_url" % name]
+            builder.__qualname__ = "%s._%s_url" % (cls.__qualname__, name)
+            builder.__doc__ = "Return the url prefix %s and a%s fetch." % (name, name)
+            setattr(cls, builder.__name__, builder)
+
+            awaitable = namespace["a" + name]
+            awaitable.__qualname__ = "%s.a%s" % (cls.__qualname__, name)
+            awaitable.__annotations__ = dict(method.__annotations__, **{"return": dict})
+            awaitable.__doc__ = (
+                "Awaitable %s.\nSee fred.%s for parameters and returned data."
+                % (name, name)
+            )
+            setattr(cls, awaitable.__name__, awaitable)
+        return cls
+
+    return decorate
+
 
 class FredBase:
+    _ATTRIBUTE_DEFAULT_NAMES = (
+        "realtime_start",
+        "realtime_end",
+        "observation_start",
+        "observation_end",
+    )
+    # parameters _add_query_params sends as lowercase str, e.g. True -> "true"
+    _LOWERCASE_PARAMS = frozenset(("include_release_dates_with_no_data",))
+    # parameters _add_query_params joins by ";"
+    _TAG_NAMES_PARAMS = frozenset(("tag_names", "exclude_tag_names"))
+
     def __init__(
         self,
         api_key_file: str = None,
@@ -17,11 +144,56 @@ class FredBase:
         self.observation_start = None
         self.observation_end = None
         self.__url_base = "https://api.stlouisfed.org/fred/"
+        self._attribute_defaults_key = None
+        self._attribute_defaults = dict()
+        self._session = requests.Session()
+        self._semaphore = None
+        self._semaphore_loop = None
+        self._inflight = dict()
+        self._executor = None
+        self.max_concurrent_requests = 10
+        self.timeout = 30
+        self.cache_expire_after = 3600
+        self.cache_maxsize = 256
+        self._response_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._failed_cache_file = None
+        self.cache_file = None
         if api_key_file is not None:
             self.set_api_key_file(api_key_file)
         else:
             self.api_key_file = api_key_file
 
+    @property
+    def max_concurrent_requests(self) -> int:
+        """
+        The most requests gather, the awaitable methods and paginate
+        have in flight at once.
+        """
+        return self._max_concurrent_requests
+
+    @max_concurrent_requests.setter
+    def max_concurrent_requests(
+        self,
+        max_requests: int,
+    ):
+        """
+        Size the session's connection pool to max_requests keep-alive
+        connections. Requests block for a free pooled connection rather
+        than opening one that would be discarded after a single use.
+        The awaitable methods get their own max_requests threads, so the
+        event loop's default executor doesn't cap them.
+        """
+        self._max_concurrent_requests = max_requests
+        # close the pool being replaced so its idle connections aren't leaked
+        self._session.get_adapter("https://").close()
+        adapter = HTTPAdapter(pool_maxsize=max_requests, pool_block=True)
+        self._session.mount("https://", adapter)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self._executor = ThreadPoolExecutor(max_workers=max_requests)
+        self._semaphore = None
+
     def get_api_key_file(
         self,
     ) -> str:
@@ -43,6 +215,44 @@ class FredBase:
         self.api_key_file = api_key_file
         return True
 
+    def get_cache_file(
+        self,
+    ) -> str:
+        """
+        Return currently assigned cache_file.
+        """
+        return self.cache_file
+
+    def set_cache_file(
+        self,
+        cache_file: str,
+    ) -> bool:
+        """
+        Keep responses in the SQLite database cache_file as well as in memory
+        so they're reused across sessions for cache_expire_after seconds.
+        cache_file is created if it doesn't exist. Pass None to stop using it.
+        Return True once cache_file is ready.
+        """
+        self.cache_file = cache_file
+        if cache_file is not None:
+            self._connect_cache_file().close()
+        return True
+
+    def _connect_cache_file(
+        self,
+    ) -> sqlite3.Connection:
+        """
+        Return a connection to cache_file, creating its responses table if
+        needed, so cache_file also works when assigned directly.
+        """
+        connection = sqlite3.connect(self.cache_file)
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(url TEXT PRIMARY KEY, json TEXT, fetched_at REAL)"
+            )
+        return connection
+
     def _read_api_key_file(
         self,
     ) -> str:
@@ -96,53 +306,85 @@ class FredBase:
         -----
         Not all paramaters passed in optional_params need be optional. Most are.
 
-        If tag_names is a substring of a parameter in optional_params, whitespace is
-        replaced with "+" so the request URL encodes the whitespace in a standard way.
-        There's more on this at
+        Values of tag_names and exclude_tag_names parameters are joined by ";".
+
+        Values are percent-encoded in one urllib.parse.urlencode pass, which
+        replaces whitespace with "+" so the request URL encodes the whitespace
+        in a standard way. There's more on this at
         https://fred.stlouisfed.org/docs/api/fred/related_tags.html
         """
-        new_url_string = og_url_string
+        # "&limit=" -> "limit"
+        keys = [k[1:-1] for k in optional_params.keys()]
+        return self._add_query_params(og_url_string, keys, optional_params.values())
+
+    def _add_query_params(
+        self,
+        og_url_string: str,
+        keys: tuple,
+        values: tuple,
+    ) -> str:
+        """
+        Return og_url_string with a query parameter added for each non-None value in
+        values, named by the key at the same position in keys. Same rules as
+        _add_optional_params, without a dictionary to build for each query.
+
+        Parameters
+        ----------
+        og_url_string: str
+            the string to append new, non-null parameter strings to
+        keys: tuple
+            parameter names, e.g. ("realtime_start", "limit")
+        values: tuple
+            arguments passed by user, in the order of keys
 
+        Returns
+        -------
+        str
+            og_url_string with any non-None parameters concatenated to it.
+        """
         # use user-set attribute value if set and argument for it 
-        # isn't passed in optional_params
-        attribute_map = {
-                "&observation_start=": self.observation_start, 
-                "&observation_end=": self.observation_end, 
-                "&realtime_start=": self.realtime_start, 
-                "&realtime_end=": self.realtime_end, 
-                }
-
-        for k in optional_params.keys():
-            if k in attribute_map.keys():
-                if optional_params[k] is None:
-                    if attribute_map[k] is not None:
-                        optional_params[k] = attribute_map[k]
-            if optional_params[k] is not None:
-                if k == "&include_release_dates_with_no_data=":
-                    try:
-                        optional_params[k] = str(optional_params[k]).lower()
-                    except TypeError:
-                        e = (
-                            "Cannot cast include_empty to str, "
-                            "cannot create request url to fetch"
-                            " data"
-                        )
-                        print(e)
-                if "tag_names" in k:
-                    tag_names = optional_params[k]
-                    try:
-                        str_names = self._join_strings_by(tag_names, ";")
-                        str_names = str_names.strip().replace(" ", "+")
-                        optional_params[k] = str_names
-                    except TypeError:
-                        e = "Cannot add tag_names to FRED query url"
-                        print(e)
-                try:
-                    a_parameter_string = k + str(optional_params[k])
-                    new_url_string += a_parameter_string
-                except TypeError:
-                    print(k + " " + optional_params[k] + " cannot be cast to str")
-        return new_url_string
+        # isn't passed
+        attribute_map = self._get_attribute_defaults()
+        # common case: every argument left to FRED's defaults
+        if not attribute_map and all(value is None for value in values):
+            return og_url_string
+
+        query_params = dict()
+        for k, value in zip(keys, values):
+            if value is None:
+                value = attribute_map.get(k)
+                if value is None:
+                    continue
+            if k in self._LOWERCASE_PARAMS:
+                value = str(value).lower()
+            elif k in self._TAG_NAMES_PARAMS:
+                value = self._join_strings_by(value, ";").strip()
+            query_params[k] = value
+        if not query_params:
+            return og_url_string
+        # one pass percent-encodes every value; whitespace becomes "+"
+        return og_url_string + "&" + urlencode(query_params, safe=",;")
+
+    def _get_attribute_defaults(self) -> dict:
+        """
+        Return the realtime_start, realtime_end, observation_start and
+        observation_end attributes that are set, by parameter name. The dict
+        is rebuilt only when one of the attributes has changed since last call.
+        """
+        current = (
+            self.realtime_start,
+            self.realtime_end,
+            self.observation_start,
+            self.observation_end,
+        )
+        if current != self._attribute_defaults_key:
+            self._attribute_defaults = {
+                name: value
+                for name, value in zip(self._ATTRIBUTE_DEFAULT_NAMES, current)
+                if value is not None
+            }
+            self._attribute_defaults_key = current
+        return self._attribute_defaults
 
     def _viable_api_key(self) -> str:
         """
@@ -192,26 +434,331 @@ class FredBase:
         url_prefix: str,
     ) -> dict:
         """
-        Make request URL, send it to FRED, return JSON upshot
+        Make request URL, send it to FRED, return JSON upshot.
+        Responses are cached by url_prefix for cache_expire_after seconds,
+        in memory and in cache_file if one is set
         """
-        url = self._make_request_url(url_prefix)
-        json_data = self._get_response(url)
-        if json_data is None:
-            # never print api key in message for security
-            message = "Data could not be retrieved, returning None"
-            print(message)
-            return
+        json_data = self._get_cached_response(url_prefix)
+        if json_data is not None:
+            return json_data
+        fetched_at = None
+        cached = self._read_cache_file(url_prefix)
+        if cached is not None:
+            # keep the age of a cache_file response so it expires on time
+            json_data, age = cached
+            fetched_at = time.monotonic() - age
+        else:
+            url = self._make_request_url(url_prefix)
+            json_data = self._get_response(url)
+            if json_data is None:
+                # never print api key in message for security
+                message = "Data could not be retrieved, returning None"
+                print(message)
+                return
+            self._write_cache_file(url_prefix, json_data)
+        self._cache_response(url_prefix, json_data, fetched_at)
         return json_data
 
+    def _read_cache_file(
+        self,
+        url_prefix: str,
+    ) -> tuple:
+        """
+        Return the response to url_prefix stored in cache_file and its age in
+        seconds, or None if there's no cache_file or no response younger than
+        cache_expire_after seconds.
+        """
+        if self.cache_file is None or not self.cache_expire_after:
+            return
+        try:
+            with closing(self._connect_cache_file()) as connection:
+                row = connection.execute(
+                    "SELECT json, fetched_at FROM responses WHERE url = ?",
+                    (url_prefix,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            self._print_cache_file_error(e)
+            return
+        if row is None:
+            return
+        age = time.time() - row[1]
+        if age > self.cache_expire_after:
+            return
+        return json_loads(row[0]), age
+
+    def _write_cache_file(
+        self,
+        url_prefix: str,
+        json_data: dict,
+    ):
+        """
+        Store json_data in cache_file by url_prefix, which doesn't contain
+        the api key, so the key is never written to disk.
+        """
+        if self.cache_file is None or not self.cache_expire_after:
+            return
+        if "error_code" in json_data:
+            return
+        try:
+            with closing(self._connect_cache_file()) as connection, connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                    (url_prefix, json_dumps(json_data), time.time()),
+                )
+        except sqlite3.Error as e:
+            self._print_cache_file_error(e)
+
+    def _print_cache_file_error(
+        self,
+        error: sqlite3.Error,
+    ):
+        """
+        Print why cache_file can't be used, once per cache_file. The cache
+        is optional, so fetching carries on from FRED.
+        """
+        if self._failed_cache_file == self.cache_file:
+            return
+        self._failed_cache_file = self.cache_file
+        print("cache_file could not be used, fetching from FRED:", error)
+
+    def _get_cached_response(
+        self,
+        url_prefix: str,
+    ) -> dict:
+        """
+        Return the cached response for url_prefix, or None if there isn't
+        one younger than cache_expire_after seconds. Each hit is parsed anew
+        so changes made to a returned response don't reach later queries.
+        """
+        with self._cache_lock:
+            cached = self._response_cache.get(url_prefix)
+            if cached is None:
+                return
+            fetched_at, serialized = cached
+            if time.monotonic() - fetched_at > self.cache_expire_after:
+                del self._response_cache[url_prefix]
+                return
+            self._response_cache.move_to_end(url_prefix)
+        return json_loads(serialized)
+
+    def _cache_response(
+        self,
+        url_prefix: str,
+        json_data: dict,
+        fetched_at: float = None,
+    ):
+        """
+        Cache json_data, serialized, by url_prefix. The key is the url without
+        the api key so the key isn't held in memory. FRED error responses
+        aren't cached. Past cache_maxsize responses the least recently used
+        one is dropped. fetched_at is the time.monotonic() json_data was
+        fetched at, now if None.
+        """
+        if not self.cache_expire_after or "error_code" in json_data:
+            return
+        if fetched_at is None:
+            fetched_at = time.monotonic()
+        serialized = json_dumps(json_data)
+        with self._cache_lock:
+            self._response_cache[url_prefix] = (fetched_at, serialized)
+            self._response_cache.move_to_end(url_prefix)
+            while len(self._response_cache) > self.cache_maxsize:
+                self._response_cache.popitem(last=False)
+
+    def clear_cache(self):
+        """
+        Forget every cached response, including those in cache_file, so the
+        next query of each is sent to FRED.
+        """
+        with self._cache_lock:
+            self._response_cache.clear()
+        if self.cache_file is None:
+            return
+        try:
+            with closing(self._connect_cache_file()) as connection, connection:
+                connection.execute("DELETE FROM responses")
+        except sqlite3.Error as e:
+            self._print_cache_file_error(e)
+
+    async def _afetch_data(
+        self,
+        url_prefix: str,
+    ) -> dict:
+        """
+        Awaitable _fetch_data. The blocking request runs in fred's own
+        executor; at most max_concurrent_requests are in flight at once.
+        Concurrent calls for the same url_prefix share a single request, and
+        each gets its own copy of the response to change as it likes.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(url_prefix)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(self._afetch_new_data(url_prefix, loop))
+            self._inflight[url_prefix] = task
+            task.add_done_callback(partial(self._forget_inflight, url_prefix))
+        # shield so one caller being cancelled doesn't cancel the others' request
+        json_data = await asyncio.shield(task)
+        return json_loads(json_dumps(json_data))
+
+    async def _afetch_new_data(
+        self,
+        url_prefix: str,
+        loop: asyncio.AbstractEventLoop,
+    ) -> dict:
+        """
+        Run _fetch_data for url_prefix on fred's executor once the
+        semaphore allows another request.
+        """
+        async with self._get_semaphore(loop):
+            return await loop.run_in_executor(
+                self._executor, self._fetch_data, url_prefix
+            )
+
+    def _forget_inflight(
+        self,
+        url_prefix: str,
+        task: asyncio.Task,
+    ):
+        """
+        Drop the finished task for url_prefix so later calls start a new one.
+        """
+        if self._inflight.get(url_prefix) is task:
+            del self._inflight[url_prefix]
+
+    def _fetch_pages(
+        self,
+        url_prefix: str,
+        results_key: str,
+    ) -> dict:
+        """
+        Fetch the page url_prefix asks for, then every page after it with at
+        most max_concurrent_requests in flight, and return the first page with
+        the results of all pages under results_key.
+        """
+        first_page = self._fetch_data(url_prefix)
+        page_url_prefixes = self._next_page_url_prefixes(url_prefix, first_page)
+        if not page_url_prefixes:
+            return first_page
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as pool:
+            pages = list(pool.map(self._fetch_data, page_url_prefixes))
+        return self._merge_pages(first_page, pages, results_key)
+
+    async def _afetch_pages(
+        self,
+        url_prefix: str,
+        results_key: str,
+    ) -> dict:
+        """
+        Awaitable _fetch_pages.
+        """
+        first_page = await self._afetch_data(url_prefix)
+        page_url_prefixes = self._next_page_url_prefixes(url_prefix, first_page)
+        if not page_url_prefixes:
+            return first_page
+        pages = await asyncio.gather(
+            *(self._afetch_data(u) for u in page_url_prefixes)
+        )
+        return self._merge_pages(first_page, pages, results_key)
+
+    def _next_page_url_prefixes(
+        self,
+        url_prefix: str,
+        first_page: dict,
+    ) -> list:
+        """
+        Return url prefixes of the pages after first_page, using the count,
+        offset and limit FRED reports in first_page.
+        """
+        if first_page is None or "count" not in first_page:
+            return []
+        limit = first_page["limit"]
+        start = first_page["offset"] + limit
+        url_prefix = re.sub(r"&offset=[^&]*", "", url_prefix)
+        return [
+            url_prefix + "&offset=" + str(offset)
+            for offset in range(start, first_page["count"], limit)
+        ]
+
+    def _merge_pages(
+        self,
+        first_page: dict,
+        pages: list,
+        results_key: str,
+    ) -> dict:
+        """
+        Return a copy of first_page whose results_key holds the results of
+        first_page followed by those of pages. If a page is missing return None.
+        """
+        merged = dict(first_page)
+        merged[results_key] = list(first_page[results_key])
+        for page in pages:
+            if page is None or results_key not in page:
+                message = "A page of data could not be retrieved, returning None"
+                print(message)
+                return
+            merged[results_key].extend(page[results_key])
+        return merged
+
+    def _get_semaphore(
+        self,
+        loop: asyncio.AbstractEventLoop,
+    ) -> asyncio.BoundedSemaphore:
+        """
+        Return the semaphore bounding concurrent requests made from loop,
+        creating a new one if loop isn't the loop the last one was made for.
+        """
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.BoundedSemaphore(self.max_concurrent_requests)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def gather(
+        self,
+        *aws,
+    ) -> list:
+        """
+        Run awaitables such as those returned by fred.aget_a_source concurrently
+        and return their results in the order they were passed.
+
+        Parameters
+        ----------
+        *aws: awaitable
+            Awaitables to run, e.g. fred.aget_a_source(1), fred.aget_all_tags().
+
+        Returns
+        -------
+        list
+            Results of aws.
+
+        Notes
+        -----
+        gather starts its own event loop so it's meant to be called from
+        synchronous code. Inside a running event loop await
+        asyncio.gather(*aws) instead.
+
+        Examples
+        --------
+        >>> fred.gather(*(fred.aget_a_source(i) for i in (1, 3, 57)))
+        [{'realtime_start': '2021-04-05', 'realtime_end': '2021-04-05',
+        'sources': [{'id': 1, ..........
+        """
+
+        async def gather_aws():
+            return await asyncio.gather(*aws)
+
+        return asyncio.run(gather_aws())
+
     def _get_response(self, a_url: str) -> dict:
         """
-        Return a JSON dictionary response with data retrieved from a_url
+        Return a JSON dictionary response with data retrieved from a_url.
+        Give up on FRED after timeout seconds so a stalled connection can't
+        hold up requests waiting for a pooled connection.
         """
         try:
-            response = requests.get(a_url)
+            response = self._session.get(a_url, timeout=self.timeout)
         except RequestException:
             return
-        return response.json()
+        return json_loads(response.content)
 
     def _append_id_to_url(
         self,
@@ -225,14 +772,21 @@ class FredBase:
         if an_int_id is None and a_str_id is None:
             raise ValueError("No id argument given, cannot append to url")
         passed_id = an_int_id
-        new_url_str = a_url_prefix
         if passed_id is None:
             passed_id = a_str_id
-        try:
-            new_url_str += str(passed_id)
-        except TypeError:
-            print("Unable to cast id to str, cannot append to url string")
-        return new_url_str
+        self._check_id(passed_id)
+        return a_url_prefix + str(passed_id)
+
+    def _check_id(
+        self,
+        passed_id,
+    ):
+        """
+        Raise TypeError unless passed_id is an int or str that can go in a url.
+        """
+        if not isinstance(passed_id, (Integral, str)):
+            e = "id must be an int or str, not %s" % type(passed_id).__name__
+            raise TypeError(e)
 
     def _join_strings_by(
         self,
@@ -240,12 +794,14 @@ class FredBase:
         use_str: str,
     ) -> str:
         """
-        Join an iterable of strings using use_str and return the fused string.
+        Join a list or tuple of strings using use_str and return the fused string.
+        A lone str is taken as a single string and returned as is.
         """
         if strings is None or use_str is None:
             raise TypeError("strings and use_str are both required")
-        try:
-            fused_str = use_str.join(strings)
-        except TypeError:
-            print("Unable to join strings using %s" % use_str)
-        return fused_str
+        if isinstance(strings, str):
+            return strings
+        if not isinstance(strings, (list, tuple)):
+            e = "strings must be a list or tuple, not %s" % type(strings).__name__
+            raise TypeError(e)
+        return use_str.join(strings)
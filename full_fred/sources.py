@@ -1,7 +1,38 @@
+from .fred_base import endpoint_methods
 from .series import Series
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 
 
+@endpoint_methods("source_stack")
 class Sources(Series):
+    # names of the query parameters each method sends, in _add_query_params order
+    _ALL_SOURCES_KEYS = (
+        "realtime_start",
+        "realtime_end",
+        "limit",
+        "offset",
+        "order_by",
+        "sort_order",
+    )
+    _A_SOURCE_KEYS = (
+        "realtime_start",
+        "realtime_end",
+    )
+    # see fred_base.endpoint_methods, which generates aget_all_sources etc. from this
+    _ENDPOINTS = {
+        "get_all_sources": ("sources?", None, _ALL_SOURCES_KEYS, "sources"),
+        "get_a_source": ("source?source_id=", "source_id", _A_SOURCE_KEYS, None),
+        "get_releases_for_a_source": (
+            "source/releases?source_id=",
+            "source_id",
+            _ALL_SOURCES_KEYS,
+            "releases",
+        ),
+    }
+    # above this many ids get_sources_bulk fetches every source in one sweep
+    _BULK_SOURCES_THRESHOLD = 20
+
     def __init__(self):
         """
         FRED source = a provider of economic data series such as
@@ -18,6 +49,7 @@ class Sources(Series):
         offset: int = None,
         order_by: str = None,
         sort_order: str = None,
+        paginate: bool = False,
     ) -> dict:
         """
         Get all sources of economic data.
@@ -47,6 +79,9 @@ class Sources(Series):
             Sort results in ascending or descending order for attribute values specified by order_by.
             Can be "asc" or "desc".
             If None, "asc" is used.
+        paginate: bool, default False
+            If True, every page of results from offset on is fetched, at most
+            fred.max_concurrent_requests pages at a time, and merged into one response.
 
         Returns
         -------
@@ -80,18 +115,19 @@ class Sources(Series):
             'link': 'http://www.worldbank.org/'},
             {'id': 44, ..........
         """
-        self._viable_api_key()
-        url_prefix = "sources?"
-        optional_args = {
-            "&realtime_start=": realtime_start,
-            "&realtime_end=": realtime_end,
-            "&limit=": limit,
-            "&offset=": offset,
-            "&order_by=": order_by,
-            "&sort_order=": sort_order,
-        }
-        url = self._add_optional_params(url_prefix, optional_args)
-        self.source_stack["get_all_sources"] = self._fetch_data(url)
+        url = self._get_all_sources_url(
+            realtime_start,
+            realtime_end,
+            limit,
+            offset,
+            order_by,
+            sort_order,
+        )
+        if paginate:
+            response = self._fetch_pages(url, "sources")
+        else:
+            response = self._fetch_data(url)
+        self.source_stack["get_all_sources"] = response
         return self.source_stack["get_all_sources"]
 
     def get_a_source(
@@ -141,17 +177,7 @@ class Sources(Series):
         'name': 'Board of Governors of the Federal Reserve System (US)',
         'link': 'http://www.federalreserve.gov/'}]}
         """
-        self._viable_api_key()
-        url_prefix_params = {
-            "a_url_prefix": "source?source_id=",
-            "an_int_id": source_id,
-        }
-        url_prefix = self._append_id_to_url(**url_prefix_params)
-        optional_args = {
-            "&realtime_start=": realtime_start,
-            "&realtime_end=": realtime_end,
-        }
-        url = self._add_optional_params(url_prefix, optional_args)
+        url = self._get_a_source_url(source_id, realtime_start, realtime_end)
         self.source_stack["get_a_source"] = self._fetch_data(url)
         return self.source_stack["get_a_source"]
 
@@ -164,6 +190,7 @@ class Sources(Series):
         offset: int = None,
         order_by: str = None,
         sort_order: str = None,
+        paginate: bool = False,
     ):
         """
         Get the releases for a source.
@@ -195,6 +222,9 @@ class Sources(Series):
             Sort results in ascending or descending order for attribute values specified by order_by.
             Can be "asc" or "desc".
             If None, "asc" is used.
+        paginate: bool, default False
+            If True, every page of results from offset on is fetched, at most
+            fred.max_concurrent_requests pages at a time, and merged into one response.
 
         Returns
         -------
@@ -229,20 +259,149 @@ class Sources(Series):
             'link': 'http://www.federalreserve.gov/releases/g17/'},
             {'id': 14, ......
         """
-        self._viable_api_key()
-        url_prefix_params = {
-            "a_url_prefix": "source/releases?source_id=",
-            "an_int_id": source_id,
-        }
-        url_prefix = self._append_id_to_url(**url_prefix_params)
-        optional_args = {
-            "&realtime_start=": realtime_start,
-            "&realtime_end=": realtime_end,
-            "&limit=": limit,
-            "&offset=": offset,
-            "&order_by=": order_by,
-            "&sort_order=": sort_order,
-        }
-        url = self._add_optional_params(url_prefix, optional_args)
-        self.source_stack["get_releases_for_a_source"] = self._fetch_data(url)
+        url = self._get_releases_for_a_source_url(
+            source_id,
+            realtime_start,
+            realtime_end,
+            limit,
+            offset,
+            order_by,
+            sort_order,
+        )
+        if paginate:
+            response = self._fetch_pages(url, "releases")
+        else:
+            response = self._fetch_data(url)
+        self.source_stack["get_releases_for_a_source"] = response
         return self.source_stack["get_releases_for_a_source"]
+
+    def get_sources_bulk(
+        self,
+        source_ids: list,
+        realtime_start: str = None,
+        realtime_end: str = None,
+    ) -> dict:
+        """
+        Get several sources of economic data by source id.
+
+        Parameters
+        ----------
+        source_ids: list
+            The IDs of the sources.
+        realtime_start: str, default None
+            The start of the real-time period formatted as "YYYY-MM-DD".
+            If None, fred.realtime_start is used.
+            If fred.realtime_start = None, FRED web service will use today's date.
+        realtime_end: str, default None
+            The end of the real-time period formatted as "YYYY-MM-DD".
+            If None, fred.realtime_end is used.
+            If fred.realtime_end = None, FRED web service will use today's date.
+
+        Returns
+        -------
+        dict
+            Metadata of each requested source found, keyed by source id.
+
+        See Also
+        --------
+        fred.get_a_source: Get a source of economic data.
+        fred.get_all_sources: Get all sources of economic data.
+
+        Notes
+        -----
+        For more than 20 source_ids every source is fetched with one
+        get_all_sources sweep and filtered. Otherwise each source is fetched
+        with its own request, at most fred.max_concurrent_requests at a time.
+
+        Examples
+        --------
+        >>> fred.get_sources_bulk([1, 3])
+        {1: {'id': 1,
+            'realtime_start': '2021-04-05',
+            'realtime_end': '2021-04-05',
+            'name': 'Board of Governors of the Federal Reserve System (US)',
+            'link': 'http://www.federalreserve.gov/'},
+        3: {'id': 3, ..........
+        """
+        for source_id in source_ids:
+            self._check_id(source_id)
+        if len(source_ids) > self._BULK_SOURCES_THRESHOLD:
+            url = self._get_all_sources_url(
+                realtime_start, realtime_end, None, None, None, None
+            )
+            all_sources = self._fetch_pages(url, "sources")
+            sources = self._filter_sources(source_ids, all_sources)
+        else:
+            url_prefixes = [
+                self._get_a_source_url(i, realtime_start, realtime_end)
+                for i in source_ids
+            ]
+            with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as pool:
+                responses = list(pool.map(self._fetch_data, url_prefixes))
+            sources = self._collect_sources(responses)
+        self.source_stack["get_sources_bulk"] = sources
+        return self.source_stack["get_sources_bulk"]
+
+    async def aget_sources_bulk(
+        self,
+        source_ids: list,
+        realtime_start: str = None,
+        realtime_end: str = None,
+    ) -> dict:
+        """
+        Awaitable get_sources_bulk.
+        See fred.get_sources_bulk for parameters and returned data.
+        """
+        for source_id in source_ids:
+            self._check_id(source_id)
+        if len(source_ids) > self._BULK_SOURCES_THRESHOLD:
+            url = self._get_all_sources_url(
+                realtime_start, realtime_end, None, None, None, None
+            )
+            all_sources = await self._afetch_pages(url, "sources")
+            sources = self._filter_sources(source_ids, all_sources)
+        else:
+            responses = await asyncio.gather(
+                *(
+                    self._afetch_data(
+                        self._get_a_source_url(i, realtime_start, realtime_end)
+                    )
+                    for i in source_ids
+                )
+            )
+            sources = self._collect_sources(responses)
+        self.source_stack["get_sources_bulk"] = sources
+        return self.source_stack["get_sources_bulk"]
+
+    def _filter_sources(
+        self,
+        source_ids: list,
+        all_sources: dict,
+    ) -> dict:
+        """
+        Return the sources in a get_all_sources response whose id is in
+        source_ids, keyed by id. Ids are compared as str, like they're sent
+        in urls, so ids FRED doesn't know are skipped as get_a_source skips them.
+        """
+        if all_sources is None or "sources" not in all_sources:
+            return
+        wanted = {str(i) for i in source_ids}
+        return {
+            s["id"]: s for s in all_sources["sources"] if str(s["id"]) in wanted
+        }
+
+    def _collect_sources(
+        self,
+        responses: list,
+    ) -> dict:
+        """
+        Return the source in each get_a_source response, keyed by id.
+        Responses without a source, e.g. for an unknown id, are skipped.
+        """
+        sources = dict()
+        for response in responses:
+            if response is None or not response.get("sources"):
+                continue
+            source = response["sources"][0]
+            sources[source["id"]] = source
+        return sources
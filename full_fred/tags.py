@@ -1,7 +1,60 @@
+from .fred_base import endpoint_methods
 from .sources import Sources
 
 
+@endpoint_methods("tag_stack")
 class Tags(Sources):
+    # names of the query parameters each method sends, in _add_query_params order
+    _ALL_TAGS_KEYS = (
+        "realtime_start",
+        "realtime_end",
+        "tag_names",
+        "tag_group_id",
+        "search_text",
+        "limit",
+        "offset",
+        "order_by",
+        "sort_order",
+    )
+    _RELATED_TAGS_FOR_A_TAG_KEYS = (
+        "tag_names",
+        "realtime_start",
+        "realtime_end",
+        "exclude_tag_names",
+        "tag_group_id",
+        "search_text",
+        "limit",
+        "offset",
+        "order_by",
+        "sort_order",
+    )
+    _SERIES_MATCHING_TAGS_KEYS = (
+        "tag_names",
+        "exclude_tag_names",
+        "realtime_start",
+        "realtime_end",
+        "limit",
+        "offset",
+        "order_by",
+        "sort_order",
+    )
+    # see fred_base.endpoint_methods, which generates aget_all_tags etc. from this
+    _ENDPOINTS = {
+        "get_all_tags": ("tags?", None, _ALL_TAGS_KEYS, "tags"),
+        "get_related_tags_for_a_tag": (
+            "related_tags?",
+            None,
+            _RELATED_TAGS_FOR_A_TAG_KEYS,
+            "tags",
+        ),
+        "get_series_matching_tags": (
+            "tags/series?",
+            None,
+            _SERIES_MATCHING_TAGS_KEYS,
+            "seriess",
+        ),
+    }
+
     def __init__(self):
         """
         FRED tag = an attribute assigned to a series.
@@ -23,6 +76,7 @@ class Tags(Sources):
         offset: int = None,
         order_by: str = None,
         sort_order: str = None,
+        paginate: bool = False,
     ) -> dict:
         """
         Get all FRED tags, search for FRED tags, get metadata for FRED tags.
@@ -64,6 +118,9 @@ class Tags(Sources):
             Sort results in ascending or descending order for attribute values specified by order_by.
             Can be "asc" or "desc".
             If None, "asc" is used.
+        paginate: bool, default False
+            If True, every page of results from offset on is fetched, at most
+            fred.max_concurrent_requests pages at a time, and merged into one response.
 
         Returns
         -------
@@ -98,21 +155,22 @@ class Tags(Sources):
             'series_count': 64090},
             {'name': 'gdp', ...........
         """
-        self._viable_api_key()
-        url_prefix = "tags?"
-        optional_args = {
-            "&realtime_start=": realtime_start,
-            "&realtime_end=": realtime_end,
-            "&tag_names=": tag_names,
-            "&tag_group_id=": tag_group_id,
-            "&search_text=": search_text,
-            "&limit=": limit,
-            "&offset=": offset,
-            "&order_by=": order_by,
-            "&sort_order=": sort_order,
-        }
-        url = self._add_optional_params(url_prefix, optional_args)
-        self.tag_stack["get_all_tags"] = self._fetch_data(url)
+        url = self._get_all_tags_url(
+            realtime_start,
+            realtime_end,
+            tag_names,
+            tag_group_id,
+            search_text,
+            limit,
+            offset,
+            order_by,
+            sort_order,
+        )
+        if paginate:
+            response = self._fetch_pages(url, "tags")
+        else:
+            response = self._fetch_data(url)
+        self.tag_stack["get_all_tags"] = response
         return self.tag_stack["get_all_tags"]
 
     def get_related_tags_for_a_tag(
@@ -127,6 +185,7 @@ class Tags(Sources):
         offset: int = None,
         order_by: str = None,
         sort_order: str = None,
+        paginate: bool = False,
     ) -> dict:
         """
          Get related FRED tags for one or more FRED tags.
@@ -170,6 +229,9 @@ class Tags(Sources):
              Sort results in ascending or descending order for attribute values specified by order_by.
              Can be "asc" or "desc".
              If None, "asc" is used.
+         paginate: bool, default False
+             If True, every page of results from offset on is fetched, at most
+             fred.max_concurrent_requests pages at a time, and merged into one response.
 
          Returns
          -------
@@ -207,26 +269,23 @@ class Tags(Sources):
              'popularity': 100,
              'series_count': 14}]}
         """
-        self._viable_api_key()
-        fused_tag_names = self._join_strings_by(tag_names, ";")
-        url_prefix_params = {
-            "a_url_prefix": "related_tags?tag_names=",
-            "a_str_id": fused_tag_names,
-        }
-        url_prefix = self._append_id_to_url(**url_prefix_params)
-        optional_args = {
-            "&realtime_start=": realtime_start,
-            "&realtime_end=": realtime_end,
-            "&exclude_tag_names=": exclude_tag_names,
-            "&tag_group_id=": tag_group_id,
-            "&search_text=": search_text,
-            "&limit=": limit,
-            "&offset=": offset,
-            "&order_by=": order_by,
-            "&sort_order=": sort_order,
-        }
-        url = self._add_optional_params(url_prefix, optional_args)
-        self.tag_stack["get_related_tags_for_a_tag"] = self._fetch_data(url)
+        url = self._get_related_tags_for_a_tag_url(
+            tag_names,
+            realtime_start,
+            realtime_end,
+            exclude_tag_names,
+            tag_group_id,
+            search_text,
+            limit,
+            offset,
+            order_by,
+            sort_order,
+        )
+        if paginate:
+            response = self._fetch_pages(url, "tags")
+        else:
+            response = self._fetch_data(url)
+        self.tag_stack["get_related_tags_for_a_tag"] = response
         return self.tag_stack["get_related_tags_for_a_tag"]
 
     def get_series_matching_tags(
@@ -239,6 +298,7 @@ class Tags(Sources):
         offset: int = None,
         order_by: str = None,
         sort_order: str = None,
+        paginate: bool = False,
     ) -> dict:
         """
         Get the series matching all tags in tag_names parameter and
@@ -277,6 +337,9 @@ class Tags(Sources):
             Sort results in ascending or descending order for attribute values specified by order_by.
             Can be "asc" or "desc".
             If None, "asc" is used.
+        paginate: bool, default False
+            If True, every page of results from offset on is fetched, at most
+            fred.max_concurrent_requests pages at a time, and merged into one response.
 
         Returns
         -------
@@ -285,6 +348,7 @@ class Tags(Sources):
 
         See Also
         --------
+        get_related_tags_for_a_tag: get tags related to tag_names
 
         Notes
         -----
@@ -325,22 +389,19 @@ class Tags(Sources):
             'notes': 'OECD descriptor ID: XTNTVA01'
             {'id': 'XTNTVA01ESQ664S', ...........
         """
-        self._viable_api_key()
-        fused_tag_names = self._join_strings_by(tag_names, ";")
-        url_prefix_params = {
-            "a_url_prefix": "tags/series?tag_names=",
-            "a_str_id": fused_tag_names,
-        }
-        url_prefix = self._append_id_to_url(**url_prefix_params)
-        optional_args = {
-            "&exclude_tag_names=": exclude_tag_names,
-            "&realtime_start=": realtime_start,
-            "&realtime_end=": realtime_end,
-            "&limit=": limit,
-            "&offset=": offset,
-            "&order_by=": order_by,
-            "&sort_order=": sort_order,
-        }
-        url = self._add_optional_params(url_prefix, optional_args)
-        self.tag_stack["get_series_matching_tags"] = self._fetch_data(url)
+        url = self._get_series_matching_tags_url(
+            tag_names,
+            exclude_tag_names,
+            realtime_start,
+            realtime_end,
+            limit,
+            offset,
+            order_by,
+            sort_order,
+        )
+        if paginate:
+            response = self._fetch_pages(url, "seriess")
+        else:
+            response = self._fetch_data(url)
+        self.tag_stack["get_series_matching_tags"] = response
         return self.tag_stack["get_series_matching_tags"]
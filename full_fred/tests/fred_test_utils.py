@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
 import os
+from full_fred.fred_base import FredBase
 
 
 def returned_ok(
@@ -56,3 +57,39 @@ def api_key_found_in_env() -> bool:
     if "FRED_API_KEY" not in os.environ.keys():
         return False
     return True
+
+
+def fake_fred_web_service(
+    monkeypatch,
+    respond=None,
+) -> list:
+    """
+    Stand in for FRED web service in every FredBase instance.
+
+    Parameters
+    ----------
+    monkeypatch
+        pytest monkeypatch fixture; the stand-in is undone after the test.
+    respond: callable, default None
+        Called with each url sent; its return value is the response.
+        If None, each url is echoed back as {"url": url}.
+
+    Returns
+    -------
+    list
+        Each url sent, in order, appended as requests are made.
+    """
+    monkeypatch.setenv("FRED_API_KEY", "a_key")
+    sent = []
+
+    def fake_get_response(
+        fred_base: FredBase,
+        a_url: str,
+    ) -> dict:
+        sent.append(a_url)
+        if respond is None:
+            return {"url": a_url}
+        return respond(a_url)
+
+    monkeypatch.setattr(FredBase, "_get_response", fake_get_response)
+    return sent
@@ -1,7 +1,12 @@
 
+from contextlib import closing
+import inspect
+import os
+import threading
+import time
 import pytest
-from full_fred.fred_base import FredBase
-from .fred_test_utils import api_key_found_in_env
+from full_fred.fred_base import FredBase, endpoint_methods
+from .fred_test_utils import api_key_found_in_env, fake_fred_web_service
 
 ENV_API_KEY = api_key_found_in_env()
 
@@ -61,3 +66,327 @@ def test_add_optional_params(
 
 
 
+
+def test_gather_bounds_concurrent_requests(
+        fredbase: FredBase,
+        monkeypatch,
+        ):
+    monkeypatch.setenv("FRED_API_KEY", "a_key")
+    in_flight = []
+    most_in_flight = []
+
+    def fake_get_response(a_url: str) -> dict:
+        in_flight.append(a_url)
+        most_in_flight.append(len(in_flight))
+        time.sleep(0.01)
+        in_flight.pop()
+        return {"url": a_url}
+
+    monkeypatch.setattr(fredbase, "_get_response", fake_get_response)
+    fredbase.max_concurrent_requests = 3
+    url_prefixes = ["source?source_id=%d" % i for i in range(12)]
+    responses = fredbase.gather(*(fredbase._afetch_data(u) for u in url_prefixes))
+    assert [r["url"].split("&")[0] for r in responses] == [
+            "https://api.stlouisfed.org/fred/" + u for u in url_prefixes
+            ]
+    assert max(most_in_flight) <= 3
+
+def test_gather_reaches_max_concurrent_requests(
+        fredbase: FredBase,
+        monkeypatch,
+        ):
+    # more than the event loop's default executor has threads
+    max_requests = (os.cpu_count() or 1) + 6
+    fredbase.max_concurrent_requests = max_requests
+    lock = threading.Lock()
+    in_flight = [0]
+    most_in_flight = [0]
+
+    def respond(a_url: str) -> dict:
+        with lock:
+            in_flight[0] += 1
+            most_in_flight[0] = max(most_in_flight[0], in_flight[0])
+        time.sleep(0.1)
+        with lock:
+            in_flight[0] -= 1
+        return {"url": a_url}
+
+    fake_fred_web_service(monkeypatch, respond)
+    url_prefixes = ["source?source_id=%d" % i for i in range(2 * max_requests)]
+    fredbase.gather(*(fredbase._afetch_data(u) for u in url_prefixes))
+    assert most_in_flight[0] == max_requests
+
+def test_requests_share_one_session(
+        fredbase: FredBase,
+        monkeypatch,
+        ):
+    monkeypatch.setenv("FRED_API_KEY", "a_key")
+    sent = []
+
+    class FakeResponse:
+        content = b'{"sources": []}'
+
+    def fake_get(a_url: str, timeout: float) -> FakeResponse:
+        sent.append((a_url, timeout))
+        return FakeResponse()
+
+    monkeypatch.setattr(fredbase._session, "get", fake_get)
+    fredbase._fetch_data("sources?")
+    fredbase._fetch_data("source?source_id=1")
+    assert len(sent) == 2
+    assert all(timeout == fredbase.timeout for _, timeout in sent)
+
+@pytest.fixture
+def counted_responses(
+        monkeypatch,
+        ) -> list:
+    """
+    Stand in for FRED web service: record each url sent and echo it back
+    """
+    return fake_fred_web_service(monkeypatch)
+
+def test_repeated_query_is_served_from_cache(
+        fredbase: FredBase,
+        counted_responses: list,
+        ):
+    first = fredbase._fetch_data("source?source_id=1")
+    assert fredbase._fetch_data("source?source_id=1") == first
+    assert len(counted_responses) == 1
+    fredbase._fetch_data("source?source_id=2")
+    assert len(counted_responses) == 2
+    fredbase.clear_cache()
+    fredbase._fetch_data("source?source_id=1")
+    assert len(counted_responses) == 3
+
+def test_changing_a_response_leaves_the_cache_intact(
+        fredbase: FredBase,
+        counted_responses: list,
+        ):
+    first = fredbase._fetch_data("source?source_id=1")
+    first["x"] = 1
+    second = fredbase._fetch_data("source?source_id=1")
+    assert "x" not in second
+    second.pop("url")
+    assert "url" in fredbase._fetch_data("source?source_id=1")
+    assert len(counted_responses) == 1
+
+def test_cache_can_be_turned_off(
+        fredbase: FredBase,
+        counted_responses: list,
+        ):
+    fredbase.cache_expire_after = 0
+    fredbase._fetch_data("source?source_id=1")
+    fredbase._fetch_data("source?source_id=1")
+    assert len(counted_responses) == 2
+
+def test_add_optional_params_encodes_values(
+        fredbase: FredBase,
+        ):
+    optional_args = {
+            "&tag_names=": ("monetary aggregates", "weekly"),
+            "&search_text=": "R&D spending",
+            "&limit=": 2,
+            "&offset=": None,
+        }
+    url_string = fredbase._add_optional_params("related_tags?", optional_args)
+    assert url_string == (
+            "related_tags?&tag_names=monetary+aggregates;weekly"
+            "&search_text=R%26D+spending&limit=2"
+            )
+    assert fredbase._add_optional_params("sources?", {"&limit=": None}) == "sources?"
+
+def test_fetch_pages_merges_every_page(
+        fredbase: FredBase,
+        monkeypatch,
+        ):
+    count = 7
+
+    def respond(a_url: str) -> dict:
+        offset = int(a_url.split("&offset=")[1].split("&")[0]) if "&offset=" in a_url else 0
+        return {
+                "count": count,
+                "offset": offset,
+                "limit": 3,
+                "tags": list(range(offset, min(offset + 3, count))),
+                }
+
+    fake_fred_web_service(monkeypatch, respond)
+    merged = fredbase._fetch_pages("tags?&limit=3", "tags")
+    assert merged["tags"] == list(range(count))
+    merged = fredbase.gather(fredbase._afetch_pages("tags?&limit=3&offset=1", "tags"))[0]
+    assert merged["tags"] == list(range(1, count))
+
+def test_add_query_params_uses_attribute_defaults(
+        fredbase: FredBase,
+        observation_start_attr: str,
+        ):
+    fredbase.realtime_start = observation_start_attr
+    keys = ("realtime_start", "realtime_end", "limit")
+    url_string = fredbase._add_query_params("sources?", keys, (None, None, 5))
+    assert url_string == "sources?&realtime_start=%s&limit=5" % observation_start_attr
+
+def test_bad_id_and_tag_names_types_raise(
+        fredbase: FredBase,
+        ):
+    assert fredbase._append_id_to_url("source?source_id=", 1) == "source?source_id=1"
+    with pytest.raises(TypeError):
+        fredbase._append_id_to_url("source?source_id=", 1.5)
+    assert fredbase._join_strings_by("gnp", ";") == "gnp"
+    with pytest.raises(TypeError):
+        fredbase._join_strings_by({"gnp": 1}, ";")
+    with pytest.raises(TypeError):
+        fredbase._add_query_params("tags?", ("tag_names",), (42,))
+
+
+def test_missing_required_tag_names_raise(
+        monkeypatch,
+        ):
+    from full_fred.fred import Fred
+    monkeypatch.setenv("FRED_API_KEY", "a_key")
+    fred = Fred()
+    with pytest.raises(TypeError):
+        fred.get_related_tags_for_a_tag(None)
+    with pytest.raises(TypeError):
+        fred.get_series_matching_tags(None)
+    with pytest.raises(TypeError):
+        fred.gather(fred.aget_series_matching_tags(None))
+
+def test_connection_pool_follows_max_concurrent_requests(
+        fredbase: FredBase,
+        ):
+    replaced = fredbase._session.get_adapter("https://api.stlouisfed.org/fred/")
+    closed = []
+    replaced.close = lambda: closed.append(replaced)
+    fredbase.max_concurrent_requests = 4
+    adapter = fredbase._session.get_adapter("https://api.stlouisfed.org/fred/")
+    assert adapter._pool_maxsize == 4
+    assert adapter._pool_block
+    assert closed == [replaced]
+
+def test_attribute_defaults_follow_attribute_changes(
+        fredbase: FredBase,
+        observation_start_attr: str,
+        observation_end_attr: str,
+        ):
+    assert fredbase._get_attribute_defaults() == {}
+    fredbase.realtime_end = observation_end_attr
+    defaults = fredbase._get_attribute_defaults()
+    assert defaults == {"realtime_end": observation_end_attr}
+    assert fredbase._get_attribute_defaults() is defaults
+    fredbase.realtime_end = None
+    fredbase.observation_start = observation_start_attr
+    assert fredbase._get_attribute_defaults() == {
+            "observation_start": observation_start_attr
+            }
+
+def test_cache_drops_least_recently_used(
+        fredbase: FredBase,
+        counted_responses: list,
+        ):
+    fredbase.cache_maxsize = 2
+    fredbase._fetch_data("source?source_id=1")
+    fredbase._fetch_data("source?source_id=2")
+    fredbase._fetch_data("source?source_id=1")
+    fredbase._fetch_data("source?source_id=3")
+    assert list(fredbase._response_cache) == [
+            "source?source_id=1",
+            "source?source_id=3",
+            ]
+    assert len(counted_responses) == 3
+
+def test_cache_file_serves_later_sessions(
+        counted_responses: list,
+        tmp_path,
+        ):
+    cache_file = str(tmp_path / "fred_cache.sqlite")
+    first_session = FredBase()
+    assert first_session.set_cache_file(cache_file)
+    response = first_session._fetch_data("source?source_id=1")
+    later_session = FredBase()
+    later_session.set_cache_file(cache_file)
+    assert later_session._fetch_data("source?source_id=1") == response
+    assert len(counted_responses) == 1
+    later_session.clear_cache()
+    later_session._fetch_data("source?source_id=1")
+    assert len(counted_responses) == 2
+
+def test_assigned_cache_file_is_usable(
+        counted_responses: list,
+        fredbase: FredBase,
+        tmp_path,
+        ):
+    fredbase.cache_file = str(tmp_path / "fred_cache.sqlite")
+    fredbase._fetch_data("source?source_id=1")
+    fredbase.clear_cache()
+    fredbase._fetch_data("source?source_id=1")
+    assert len(counted_responses) == 2
+
+def test_cache_file_response_expires_at_its_own_age(
+        counted_responses: list,
+        fredbase: FredBase,
+        tmp_path,
+        ):
+    fredbase.set_cache_file(str(tmp_path / "fred_cache.sqlite"))
+    fredbase.cache_expire_after = 10
+    fredbase._write_cache_file("source?source_id=1", {"sources": [{"id": 1}]})
+    with closing(fredbase._connect_cache_file()) as connection, connection:
+        connection.execute("UPDATE responses SET fetched_at = ?", (time.time() - 9.8,))
+    assert fredbase._fetch_data("source?source_id=1") == {"sources": [{"id": 1}]}
+    assert len(counted_responses) == 0
+    time.sleep(0.3)
+    fredbase._fetch_data("source?source_id=1")
+    assert len(counted_responses) == 1
+
+def test_unusable_cache_file_falls_back_to_fred(
+        counted_responses: list,
+        fredbase: FredBase,
+        tmp_path,
+        capsys,
+        ):
+    fredbase.cache_file = str(tmp_path / "missing_dir" / "fred_cache.sqlite")
+    response = fredbase._fetch_data("source?source_id=9")
+    assert response["url"].startswith(
+            "https://api.stlouisfed.org/fred/source?source_id=9"
+            )
+    fredbase.clear_cache()
+    fredbase._fetch_data("source?source_id=9")
+    assert len(counted_responses) == 2
+    assert capsys.readouterr().out.count("cache_file could not be used") == 1
+
+def test_endpoint_methods_match_their_method(
+        ):
+    from full_fred.fred import Fred
+    for name in ("get_all_sources", "get_a_source", "get_series_matching_tags"):
+        method = inspect.signature(getattr(Fred, name))
+        awaitable = inspect.signature(getattr(Fred, "a" + name))
+        assert list(method.parameters.values()) == list(awaitable.parameters.values())
+        module = getattr(Fred, name).__module__
+        assert getattr(Fred, "a" + name).__module__ == module
+        assert getattr(Fred, "_%s_url" % name).__module__ == module
+
+    class Mismatched(FredBase):
+        _ENDPOINTS = {"get_thing": ("thing?", None, ("limit",), None)}
+
+        def get_thing(self, offset: int = None) -> dict:
+            pass
+
+    with pytest.raises(TypeError):
+        endpoint_methods("thing_stack")(Mismatched)
+
+def test_concurrent_identical_requests_share_one_request(
+        fredbase: FredBase,
+        monkeypatch,
+        ):
+    fredbase.cache_expire_after = 0
+
+    def respond(a_url: str) -> dict:
+        time.sleep(0.05)
+        return {"sources": []}
+
+    sent = fake_fred_web_service(monkeypatch, respond)
+    responses = fredbase.gather(
+            *(fredbase._afetch_data("source?source_id=42") for _ in range(5))
+            )
+    assert len(sent) == 1
+    assert all(r == responses[0] and r is not responses[0] for r in responses[1:])
+    assert fredbase._inflight == {}
@@ -3,6 +3,7 @@ from full_fred.fred import Fred
 from .fred_test_utils import (
     returned_ok,
     api_key_found_in_env,
+    fake_fred_web_service,
 )
 
 ENV_API_KEY = api_key_found_in_env()
@@ -90,3 +91,108 @@ def test_get_releases_for_a_source(
     get_releases_for_a_source_method_works: bool,
 ):
     assert get_releases_for_a_source_method_works == True
+
+
+@pytest.fixture
+def aget_a_source_method_works(
+    fred: Fred,
+    returned_ok_params: dict,
+) -> bool:
+    source_ids = (1, 3, 57)
+    responses = fred.gather(*(fred.aget_a_source(i) for i in source_ids))
+    for source_id, response in zip(source_ids, responses):
+        returned_ok_params["observed"] = response
+        returned_ok_params["check_union"] = ("sources",)
+        if not returned_ok(**returned_ok_params):
+            return False
+        if response["sources"][0]["id"] != source_id:
+            return False
+    return True
+
+
+@pytest.mark.skipif(not ENV_API_KEY, reason="Tests need api key")
+def test_aget_a_source(
+    aget_a_source_method_works: bool,
+):
+    assert aget_a_source_method_works == True
+
+
+@pytest.fixture
+def get_all_sources_paginated_method_works(
+    fred: Fred,
+) -> bool:
+    params = {
+        "limit": 25,
+        "paginate": True,
+    }
+    fred.get_all_sources(**params)
+    observed = fred.source_stack["get_all_sources"]
+    if not returned_ok(observed=observed, check_union=("sources",)):
+        return False
+    return len(observed["sources"]) == observed["count"]
+
+
+@pytest.mark.skipif(not ENV_API_KEY, reason="Tests need api key")
+def test_get_all_sources_paginated(
+    get_all_sources_paginated_method_works: bool,
+):
+    assert get_all_sources_paginated_method_works == True
+
+
+@pytest.fixture
+def fake_sources(
+    monkeypatch,
+) -> list:
+    """
+    Stand in for FRED web service with sources 1 to 50; record each url sent
+    """
+    all_sources = [{"id": i, "name": "source %d" % i} for i in range(1, 51)]
+
+    def respond(a_url: str) -> dict:
+        if "source_id=" in a_url:
+            source_id = a_url.split("source_id=")[1].split("&")[0]
+            if not source_id.isdigit():
+                return {"error_code": 400, "error_message": "Bad Request."}
+            return {"sources": [all_sources[int(source_id) - 1]]}
+        return {
+            "count": len(all_sources),
+            "offset": 0,
+            "limit": 1000,
+            "sources": all_sources,
+        }
+
+    return fake_fred_web_service(monkeypatch, respond)
+
+
+def test_get_sources_bulk_coalesces_many_ids(
+    fred: Fred,
+    fake_sources: list,
+):
+    source_ids = list(range(1, 31))
+    sources = fred.get_sources_bulk(source_ids)
+    assert sorted(sources) == source_ids
+    assert len(fake_sources) == 1
+
+
+def test_get_sources_bulk_fetches_few_ids_one_by_one(
+    fred: Fred,
+    fake_sources: list,
+):
+    sources = fred.get_sources_bulk([2, 5])
+    assert sources[5]["name"] == "source 5"
+    assert len(fake_sources) == 2
+    assert fred.gather(fred.aget_sources_bulk([2, 5]))[0] == sources
+
+
+def test_get_sources_bulk_validates_ids_the_same_way_on_both_paths(
+    fred: Fred,
+    fake_sources: list,
+):
+    many_ids = list(range(1, 31))
+    for source_ids in ([2, "abc"], many_ids + ["abc"]):
+        assert sorted(fred.get_sources_bulk(source_ids)) == sorted(
+            i for i in source_ids if i != "abc"
+        )
+    for source_ids in ([2, 2.5], many_ids + [2.5]):
+        with pytest.raises(TypeError):
+            fred.get_sources_bulk(source_ids)
@@ -3,6 +3,7 @@ from full_fred.fred import Fred
 from .fred_test_utils import (
     returned_ok,
     api_key_found_in_env,
+    fake_fred_web_service,
 )
 
 ENV_API_KEY = api_key_found_in_env()
@@ -115,3 +116,29 @@ def test_get_series_matching_tags(
     get_series_matching_tags_method_works: bool,
 ):
     assert get_series_matching_tags_method_works == True
+
+
+def test_get_series_matching_tags_sends_filters_in_one_request(
+    fred: Fred,
+    monkeypatch,
+):
+    sent = fake_fred_web_service(monkeypatch, lambda a_url: {"seriess": []})
+    params = {
+        "tag_names": ("oecd", "spain"),
+        "exclude_tag_names": ("annual",),
+        "limit": 2,
+        "offset": 1,
+        "order_by": "popularity",
+        "sort_order": "desc",
+    }
+    fred.get_series_matching_tags(**params)
+    assert len(sent) == 1
+    for query in (
+        "tag_names=oecd;spain",
+        "exclude_tag_names=annual",
+        "limit=2",
+        "offset=1",
+        "order_by=popularity",
+        "sort_order=desc",
+    ):
+        assert query in sent[0]
@@ -15,6 +15,10 @@ INSTALL_REQUIRES = [
     'versioneer',
 ]
 
+EXTRAS_REQUIRE = {
+    'orjson': ['orjson'],
+}
+
 setup(
     name="full_fred",
     packages=find_packages(),
@@ -26,6 +30,7 @@ setup(
     long_description=readme,
     long_description_content_type="text/markdown",
     install_requires=INSTALL_REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     url="https://github.com/7astro7/full_fred",
     project_urls={
         "Tracker": "https://github.com/7astro7/full_fred/issues",